@@ -7,11 +7,12 @@ Features
 - System tray icon with Show/Hide and Quit.
 - Multi-turn chat; press Enter to send, Shift+Enter for newline.
 - Esc hides the popup quickly.
-- Persists minimal chat history to %APPDATA%/QuickGPT/history.json.
+- Persists minimal chat history to %APPDATA%/QuickGPT/history.jsonl (one message per line).
 - Uses OPENAI_API_KEY from environment; optional MODEL env var (defaults to gpt-5).
 
 Requirements
 pip install PySide6 keyboard openai python-dotenv
+Optional: pip install orjson (faster history reads/writes)
 
 Troubleshooting
 - Set QUICKGPT_DEBUG=1 to see debug logs inside the popup.
@@ -23,19 +24,41 @@ import html
 import os
 import sys
 import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+# Fast JSON for history (de)serialization; both variants work on bytes
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to a temp file, fsync it, then rename it over path."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 # Quiet noisy Qt warnings on some Windows setups
 os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.*=false")
 
-# Global hotkey fallback lib (if native fails)
-try:
-    import keyboard  # type: ignore
-except Exception:
-    keyboard = None
-
 # --- Native Windows global hotkey (reliable) ---
 import ctypes
 from ctypes import wintypes
@@ -45,26 +68,50 @@ MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 MOD_WIN = 0x0008
 WM_HOTKEY = 0x0312
+# Qt reports the native event type as a QByteArray; compare against bytes to skip str encoding
+WIN_MSG_EVENT_TYPE = b"windows_generic_MSG"
+
+
+class MSG(ctypes.Structure):
+    _fields_ = [("hwnd", wintypes.HWND), ("message", wintypes.UINT), ("wParam", wintypes.WPARAM), ("lParam", wintypes.LPARAM), ("time", wintypes.DWORD), ("pt_x", wintypes.LONG), ("pt_y", wintypes.LONG)]
+
 
-VK_MAP: dict[str, int] = {
+VK_MAP: Mapping[str, int] = MappingProxyType({
     "space": 0x20,
     "tab": 0x09,
     "escape": 0x1B,
     "esc": 0x1B,
     "enter": 0x0D,
-}
-VK_MAP.update({f"f{i}": 0x70 + i - 1 for i in range(1, 25)})
-for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789":
-    VK_MAP[ch.lower()] = ord(ch)
+    **{f"f{i}": 0x70 + i - 1 for i in range(1, 25)},
+    **{ch.lower(): ord(ch) for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"},
+})
+
+_MOD_MAP: Mapping[str, int] = MappingProxyType({
+    "ctrl": MOD_CONTROL,
+    "control": MOD_CONTROL,
+    "alt": MOD_ALT,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "meta": MOD_WIN,
+    "super": MOD_WIN,
+})
 
 user32 = ctypes.windll.user32
 
 APP_NAME = "QuickGPT"
 DEFAULT_MODEL = os.getenv("MODEL", "gpt-5")
 HISTORY_DIR = Path(os.getenv("APPDATA", str(Path.home()))) / APP_NAME
-HISTORY_PATH = HISTORY_DIR / "history.json"
+HISTORY_PATH = HISTORY_DIR / "history.json"  # legacy monolithic file, migrated on load
+HISTORY_JSONL = HISTORY_DIR / "history.jsonl"
+HISTORY_META = HISTORY_DIR / "history.meta.json"
+HISTORY_VERSION = 1
 HOTKEY = os.getenv("QUICKGPT_HOTKEY", "ctrl+alt+space")
 DEBUG = os.getenv("QUICKGPT_DEBUG", "0") in ("1", "true", "True")
+TRANSCRIPT_MAX_LINES = 500
+MESSAGES_TRIM_AT = 400
+MESSAGES_KEEP = 200
+THINKING_TEXT = "Thinking…"
+RAINBOW_INTERVAL_MS = 50
 
 
 def parse_hotkey(s: str) -> tuple[int | None, int | None]:
@@ -72,35 +119,71 @@ def parse_hotkey(s: str) -> tuple[int | None, int | None]:
     mods = 0
     key: int | None = None
     for p in parts:
-        if p in ("ctrl", "control"):
-            mods |= MOD_CONTROL
-        elif p == "alt":
-            mods |= MOD_ALT
-        elif p == "shift":
-            mods |= MOD_SHIFT
-        elif p in ("win", "meta", "super"):
-            mods |= MOD_WIN
+        mod = _MOD_MAP.get(p)
+        if mod is not None:
+            mods |= mod
         else:
             key = VK_MAP.get(p)
     return mods, key
 
 
-# OpenAI SDK (fallback to requests if not available)
-try:
-    from openai import OpenAI  # new SDK style
-except Exception:
-    OpenAI = None
-    import requests
+# Global hotkey fallback lib (if native fails); imported on demand
+def _get_keyboard():
+    try:
+        import keyboard  # type: ignore
+    except Exception:
+        return None
+    return keyboard
+
+
+# Shared API clients so connections stay pooled/keep-alive between turns.
+# openai/requests are imported on the first request rather than at startup.
+OpenAI = None
+_openai_missing = False
+_openai_client = None
+_requests_session = None
+_client_lock = threading.Lock()
+
 
+def get_openai_client(api_key: str):
+    """Return the shared OpenAI client, or None if the SDK is not installed."""
+    global OpenAI, _openai_missing, _openai_client
+    with _client_lock:
+        if _openai_client is None and not _openai_missing:
+            if OpenAI is None:
+                try:
+                    from openai import OpenAI  # new SDK style
+                except ImportError:
+                    _openai_missing = True
+                    return None
+            _openai_client = OpenAI(api_key=api_key)
+        return _openai_client
+
+
+def get_requests_session():
+    global _requests_session
+    with _client_lock:
+        if _requests_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
 
-class Worker(QtCore.QObject):
-    finished = QtCore.Signal(str)
-    error = QtCore.Signal(str)
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+            _requests_session = session
+        return _requests_session
+
+
+class ChatTask(QtCore.QRunnable):
+    class Signals(QtCore.QObject):
+        finished = QtCore.Signal(str)
+        error = QtCore.Signal(str)
+        chunk = QtCore.Signal(str)
 
     def __init__(self, messages: list[dict], model: str):
         super().__init__()
         self.messages = messages
         self.model = model
+        self.signals = self.Signals()
 
     def run(self):
         try:
@@ -110,14 +193,23 @@ class Worker(QtCore.QObject):
                     "OPENAI_API_KEY is not set. Set it in your environment or a .env file."
                 )
 
-            if OpenAI is not None:
-                client = OpenAI(api_key=api_key)
-                resp = client.chat.completions.create(
+            client = get_openai_client(api_key)
+            if client is not None:
+                stream = client.chat.completions.create(
                     model=self.model,
                     messages=self.messages,
                     temperature=1,
+                    stream=True,
                 )
-                text = resp.choices[0].message.content or ""
+                parts: list[str] = []
+                for event in stream:
+                    if not event.choices:
+                        continue
+                    delta = event.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        self.signals.chunk.emit(delta)
+                text = "".join(parts)
             else:
                 headers = {
                     "Authorization": f"Bearer {api_key}",
@@ -128,7 +220,7 @@ class Worker(QtCore.QObject):
                     "messages": self.messages,
                     "temperature": 0.7,
                 }
-                r = requests.post(
+                r = get_requests_session().post(
                     "https://api.openai.com/v1/chat/completions",
                     headers=headers,
                     json=payload,
@@ -138,50 +230,68 @@ class Worker(QtCore.QObject):
                 data = r.json()
                 text = data["choices"][0]["message"]["content"]
 
-            self.finished.emit(text)
+            self.signals.finished.emit(text)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class GradientBorderWidget(QtWidgets.QWidget):
+    # Rainbow stops for the conical gradient; QColor objects are built once, not per paint
+    _STOP_POS = (0.0, 0.17, 0.33, 0.50, 0.67, 0.83, 1.0)
+    _COLORS = tuple(
+        QtGui.QColor(c)
+        for c in ("#ff0000", "#ff7f00", "#ffff00", "#00ff00", "#0000ff", "#4b0082", "#ff0000")
+    )
+
     def __init__(self, radius: int = 16, border_width: int = 3, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._radius = radius
         self._border_width = border_width
         self._angle = 0
         self._ring_opacity = 0.0
+        self._cached_ring: QtGui.QPainterPath | None = None
+        self._cached_size: QtCore.QSize | None = None
+        self._cached_center: QtCore.QPointF | None = None
 
     def set_angle(self, angle: int):
         self._angle = angle % 360
         self.update()
 
+    def resizeEvent(self, event):
+        self._cached_ring = None
+        super().resizeEvent(event)
+
+    def _ring_path(self) -> QtGui.QPainterPath:
+        # The ring only depends on the widget size; rotating the gradient doesn't need a new path
+        size = self.size()
+        if self._cached_ring is None or size != self._cached_size:
+            rect = QtCore.QRectF(self.rect().adjusted(1, 1, -1, -1))
+            outer = QtGui.QPainterPath()
+            outer.addRoundedRect(rect, self._radius, self._radius)
+
+            inner = QtGui.QPainterPath()
+            inner.addRoundedRect(
+                rect.adjusted(self._border_width, self._border_width, -self._border_width, -self._border_width),
+                max(0, self._radius - self._border_width),
+                max(0, self._radius - self._border_width),
+            )
+
+            self._cached_ring = outer.subtracted(inner)
+            self._cached_size = size
+            self._cached_center = rect.center()
+        return self._cached_ring
+
     def paintEvent(self, event):
         super().paintEvent(event)
+        if self._ring_opacity <= 0.0:
+            return
+        ring = self._ring_path()
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
-        rect = self.rect().adjusted(1, 1, -1, -1)
-        outer = QtGui.QPainterPath()
-        outer.addRoundedRect(rect, self._radius, self._radius)
-
-        inner = QtGui.QPainterPath()
-        inner.addRoundedRect(
-            rect.adjusted(self._border_width, self._border_width, -self._border_width, -self._border_width),
-            max(0, self._radius - self._border_width),
-            max(0, self._radius - self._border_width),
-        )
-
-        ring = outer.subtracted(inner)
-
-        center = rect.center()
-        grad = QtGui.QConicalGradient(center, self._angle)
-        grad.setColorAt(0.0, QtGui.QColor("#ff0000"))
-        grad.setColorAt(0.17, QtGui.QColor("#ff7f00"))
-        grad.setColorAt(0.33, QtGui.QColor("#ffff00"))
-        grad.setColorAt(0.50, QtGui.QColor("#00ff00"))
-        grad.setColorAt(0.67, QtGui.QColor("#0000ff"))
-        grad.setColorAt(0.83, QtGui.QColor("#4b0082"))
-        grad.setColorAt(1.0, QtGui.QColor("#ff0000"))
+        grad = QtGui.QConicalGradient(self._cached_center, self._angle)
+        for pos, color in zip(self._STOP_POS, self._COLORS):
+            grad.setColorAt(pos, color)
 
         painter.setOpacity(self._ring_opacity)
         painter.fillPath(ring, QtGui.QBrush(grad))
@@ -196,12 +306,94 @@ class GradientBorderWidget(QtWidgets.QWidget):
     ringOpacity = QtCore.Property(float, get_ring_opacity, set_ring_opacity)
 
 
+_POPUP_QSS = """
+    QFrame { background: transparent; }
+    #container {
+        background: rgba(30,30,35,235);
+        border-radius: 16px;
+    }
+    #topbar { margin-top: 2px; }
+    #closeBtn {
+        background: transparent;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        font-size: 16px;
+    }
+    #closeBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
+    #closeBtn:pressed { background: rgba(255,255,255,0.14); }
+    #clearBtn {
+        background: transparent;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        font-size: 16px;
+    }
+    #clearBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
+    #clearBtn:pressed { background: rgba(255,255,255,0.14); }
+    #sysBtn {
+        background: transparent;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        font-size: 16px;
+    }
+    #sysBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
+    #sysBtn:pressed { background: rgba(255,255,255,0.14); }
+    #output {
+        background: rgba(255,255,255,0.04);
+        border: 1px solid rgba(255,255,255,0.08);
+        border-radius: 12px;
+        padding: 8px;
+        color: #f1f1f1;
+        font-size: 14px;
+    }
+    #input {
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.12);
+        border-radius: 12px;
+        padding: 8px;
+        color: #f1f1f1;
+        font-size: 14px;
+        min-height: 44px;
+        max-height: 100px;
+    }
+    #modelCombo {
+        color: #e6e6e6;
+        font-size: 12px;
+        background: rgba(255,255,255,0.06);
+        border: 1px solid rgba(255,255,255,0.12);
+        border-radius: 8px;
+        padding: 4px 8px;
+        min-height: 24px;
+    }
+    #modelCombo::drop-down { border: none; }
+    QPushButton#sendBtn {
+        background: #6C82FF;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 10px 16px;
+        font-weight: 600;
+    }
+    QPushButton#sendBtn:hover { background: #7A8DFF; }
+    QPushButton#sendBtn:pressed { background: #5A72FF; }
+    """
+
+
 class ChatPopup(QtWidgets.QFrame):
     submitted = QtCore.Signal(str)
     model_changed = QtCore.Signal(str)
     clear_clicked = QtCore.Signal()
     toggle_system_clicked = QtCore.Signal()
 
+    # Resolved once so eventFilter avoids Qt enum attribute lookups on every keystroke
+    _EV_KEYPRESS = QtCore.QEvent.KeyPress
+    _K_RET = int(QtCore.Qt.Key_Return)
+    _K_ENT = int(QtCore.Qt.Key_Enter)
+    _K_ESC = int(QtCore.Qt.Key_Escape)
+    _K_SHIFT = QtCore.Qt.ShiftModifier
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
@@ -258,6 +450,9 @@ class ChatPopup(QtWidgets.QFrame):
 
         self.output = QtWidgets.QTextEdit()
         self.output.setReadOnly(True)
+        # Read-only transcript, one block per line: cap the document size and skip the undo stack
+        self.output.document().setMaximumBlockCount(TRANSCRIPT_MAX_LINES)
+        self.output.setUndoRedoEnabled(False)
         self.output.setObjectName("output")
         self.output.setPlaceholderText("Ask me anything…")
 
@@ -294,85 +489,38 @@ class ChatPopup(QtWidgets.QFrame):
         self._apply_styles()
 
         self._rainbow_timer = QtCore.QTimer(self)
+        self._rainbow_timer.setInterval(RAINBOW_INTERVAL_MS)
         self._rainbow_timer.timeout.connect(self._update_rainbow)
         self._rainbow_angle = 0
+        self._rainbow_active = False
+        self._busy = False
+
+        # Reusable show/hide animations; only start/end values change per toggle
+        self._pos_anim_show = QtCore.QPropertyAnimation(self, b"geometry")
+        self._pos_anim_show.setDuration(160)
+        self._pos_anim_show.setEasingCurve(QtCore.QEasingCurve.OutCubic)
+        self._op_anim_show = QtCore.QPropertyAnimation(self, b"windowOpacity")
+        self._op_anim_show.setDuration(160)
+        self._op_anim_show.setStartValue(0.0)
+        self._op_anim_show.setEndValue(1.0)
+        self._show_group = QtCore.QParallelAnimationGroup(self)
+        self._show_group.addAnimation(self._pos_anim_show)
+        self._show_group.addAnimation(self._op_anim_show)
+
+        self._pos_anim_hide = QtCore.QPropertyAnimation(self, b"geometry")
+        self._pos_anim_hide.setDuration(140)
+        self._pos_anim_hide.setEasingCurve(QtCore.QEasingCurve.InCubic)
+        self._op_anim_hide = QtCore.QPropertyAnimation(self, b"windowOpacity")
+        self._op_anim_hide.setDuration(140)
+        self._op_anim_hide.setStartValue(1.0)
+        self._op_anim_hide.setEndValue(0.0)
+        self._hide_group = QtCore.QParallelAnimationGroup(self)
+        self._hide_group.addAnimation(self._pos_anim_hide)
+        self._hide_group.addAnimation(self._op_anim_hide)
+        self._hide_group.finished.connect(lambda: (self.hide(), self.setWindowOpacity(1.0)))
         
     def _apply_styles(self):
-        self.setStyleSheet(
-            """
-            QFrame { background: transparent; }
-            #container {
-                background: rgba(30,30,35,235);
-                border-radius: 16px;
-            }
-            #topbar { margin-top: 2px; }
-            #closeBtn {
-                background: transparent;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-            }
-            #closeBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
-            #closeBtn:pressed { background: rgba(255,255,255,0.14); }
-            #clearBtn {
-                background: transparent;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-            }
-            #clearBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
-            #clearBtn:pressed { background: rgba(255,255,255,0.14); }
-            #sysBtn {
-                background: transparent;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-            }
-            #sysBtn:hover { background: rgba(255,255,255,0.08); color: #ffffff; }
-            #sysBtn:pressed { background: rgba(255,255,255,0.14); }
-            #output {
-                background: rgba(255,255,255,0.04);
-                border: 1px solid rgba(255,255,255,0.08);
-                border-radius: 12px;
-                padding: 8px;
-                color: #f1f1f1;
-                font-size: 14px;
-            }
-            #input {
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.12);
-                border-radius: 12px;
-                padding: 8px;
-                color: #f1f1f1;
-                font-size: 14px;
-                min-height: 44px;
-                max-height: 100px;
-            }
-            #modelCombo {
-                color: #e6e6e6;
-                font-size: 12px;
-                background: rgba(255,255,255,0.06);
-                border: 1px solid rgba(255,255,255,0.12);
-                border-radius: 8px;
-                padding: 4px 8px;
-                min-height: 24px;
-            }
-            #modelCombo::drop-down { border: none; }
-            QPushButton#sendBtn {
-                background: #6C82FF;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 10px 16px;
-                font-weight: 600;
-            }
-            QPushButton#sendBtn:hover { background: #7A8DFF; }
-            QPushButton#sendBtn:pressed { background: #5A72FF; }
-            """
-        )
+        self.setStyleSheet(_POPUP_QSS)
 
     # Animated show/hide to enhance hotkey UX
     def show_bottom_right(self):
@@ -383,11 +531,8 @@ class ChatPopup(QtWidgets.QFrame):
         y = geo.bottom() - h - 16
 
         # Stop any ongoing animation
-        if hasattr(self, "_anim_group") and self._anim_group is not None:
-            try:
-                self._anim_group.stop()
-            except Exception:
-                pass
+        self._show_group.stop()
+        self._hide_group.stop()
 
         # Start from slightly lower and transparent
         self.setWindowOpacity(0.0)
@@ -398,71 +543,50 @@ class ChatPopup(QtWidgets.QFrame):
         self.input.setFocus()
 
         # Animate to final position and full opacity
-        pos_anim = QtCore.QPropertyAnimation(self, b"geometry")
-        pos_anim.setDuration(160)
-        pos_anim.setStartValue(QtCore.QRect(x, y + 20, w, h))
-        pos_anim.setEndValue(QtCore.QRect(x, y, w, h))
-        pos_anim.setEasingCurve(QtCore.QEasingCurve.OutCubic)
-
-        op_anim = QtCore.QPropertyAnimation(self, b"windowOpacity")
-        op_anim.setDuration(160)
-        op_anim.setStartValue(0.0)
-        op_anim.setEndValue(1.0)
-
-        self._anim_group = QtCore.QParallelAnimationGroup(self)
-        self._anim_group.addAnimation(pos_anim)
-        self._anim_group.addAnimation(op_anim)
-        self._anim_group.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
+        self._pos_anim_show.setStartValue(QtCore.QRect(x, y + 20, w, h))
+        self._pos_anim_show.setEndValue(QtCore.QRect(x, y, w, h))
+        self._show_group.start()
 
     def hide_with_anim(self):
         # Stop any ongoing animation
-        if hasattr(self, "_anim_group") and self._anim_group is not None:
-            try:
-                self._anim_group.stop()
-            except Exception:
-                pass
+        self._show_group.stop()
+        self._hide_group.stop()
 
         geo = self.geometry()
         x, y, w, h = geo.x(), geo.y(), geo.width(), geo.height()
 
-        pos_anim = QtCore.QPropertyAnimation(self, b"geometry")
-        pos_anim.setDuration(140)
-        pos_anim.setStartValue(QtCore.QRect(x, y, w, h))
-        pos_anim.setEndValue(QtCore.QRect(x, y + 20, w, h))
-        pos_anim.setEasingCurve(QtCore.QEasingCurve.InCubic)
-
-        op_anim = QtCore.QPropertyAnimation(self, b"windowOpacity")
-        op_anim.setDuration(140)
-        op_anim.setStartValue(1.0)
-        op_anim.setEndValue(0.0)
-
-        self._anim_group = QtCore.QParallelAnimationGroup(self)
-        self._anim_group.addAnimation(pos_anim)
-        self._anim_group.addAnimation(op_anim)
-        self._anim_group.finished.connect(lambda: (self.hide(), self.setWindowOpacity(1.0)))
-        self._anim_group.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
+        self._pos_anim_hide.setStartValue(QtCore.QRect(x, y, w, h))
+        self._pos_anim_hide.setEndValue(QtCore.QRect(x, y + 20, w, h))
+        self._hide_group.start()
 
     # Use animated hide for Escape too, and Enter to send
     def eventFilter(self, obj, event):
-        if obj is self.input and event.type() == QtCore.QEvent.KeyPress:
+        if obj is self.input and event.type() == self._EV_KEYPRESS:
             key = event.key()
-            if key in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
-                if event.modifiers() & QtCore.Qt.ShiftModifier:
+            if key == self._K_RET or key == self._K_ENT:
+                if event.modifiers() & self._K_SHIFT:
                     return False
                 self._on_send()
                 return True
-            elif key == QtCore.Qt.Key_Escape:
+            elif key == self._K_ESC:
                 self.hide_with_anim()
                 return True
         return super().eventFilter(obj, event)
 
     def _on_send(self):
+        # Keep the typed text in place while a reply is still coming in
+        if self._busy:
+            return
         text = self.input.toPlainText().strip()
         if not text:
             return
         self.input.clear()
         self.submitted.emit(text)
 
+    def set_busy(self, busy: bool):
+        self._busy = busy
+        self.send_btn.setEnabled(not busy)
+
     def start_rainbow(self):
         self._rainbow_angle = 0
         self._update_rainbow()
@@ -477,9 +601,13 @@ class ChatPopup(QtWidgets.QFrame):
         self._ring_anim.setEndValue(1.0)
         self._ring_anim.setEasingCurve(QtCore.QEasingCurve.OutCubic)
         self._ring_anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
-        self._rainbow_timer.start(80)
+        self._rainbow_active = True
+        # Only animate while on screen; showEvent resumes it if the popup is hidden now
+        if self.isVisible():
+            self._rainbow_timer.start()
 
     def stop_rainbow(self):
+        self._rainbow_active = False
         self._rainbow_timer.stop()
         # Fade out the ring
         try:
@@ -493,6 +621,15 @@ class ChatPopup(QtWidgets.QFrame):
         self._ring_anim.setEasingCurve(QtCore.QEasingCurve.InCubic)
         self._ring_anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._rainbow_active and not self._rainbow_timer.isActive():
+            self._rainbow_timer.start()
+
+    def hideEvent(self, event):
+        self._rainbow_timer.stop()
+        super().hideEvent(event)
+
     def _update_rainbow(self):
         self._rainbow_angle = (self._rainbow_angle + 5) % 360
         # Update gradient border angle
@@ -544,25 +681,34 @@ class WinHotkeyFilter(QtCore.QAbstractNativeEventFilter):
         self.callback = callback  # expects (mods, vk)
 
     def nativeEventFilter(self, etype, msg):
-        # Listen for WM_HOTKEY and pass mods/vk to callback
-        try:
-            if etype != "windows_generic_MSG":
-                return False, 0
-            msg_ptr = int(msg)
-            class MSG(ctypes.Structure):
-                _fields_ = [("hwnd", wintypes.HWND), ("message", wintypes.UINT), ("wParam", wintypes.WPARAM), ("lParam", wintypes.LPARAM), ("time", wintypes.DWORD), ("pt_x", wintypes.LONG), ("pt_y", wintypes.LONG)]
-            m = MSG.from_address(msg_ptr)
-            if m.message == WM_HOTKEY:
-                lparam = int(m.lParam)
-                mods = lparam & 0xFFFF           # LOWORD
-                vk = (lparam >> 16) & 0xFFFF     # HIWORD
-                self.callback(mods, vk)
-        except Exception:
-            pass
+        # Runs for every Windows message, so bail out as early and cheaply as possible
+        if etype != WIN_MSG_EVENT_TYPE:
+            return False, 0
+        # msg is already an int address on current PySide6; older builds hand over a VoidPtr
+        m = MSG.from_address(msg if type(msg) is int else int(msg))
+        if m.message != WM_HOTKEY:
+            return False, 0
+        lparam = m.lParam
+        self.callback(lparam & 0xFFFF, (lparam >> 16) & 0xFFFF)  # LOWORD = mods, HIWORD = vk
         return False, 0
 
 
 class QuickGPT(QtWidgets.QApplication):
+    _COLOR_MAP = {
+        "system": "#FFB86C",
+        "you": "#80C7FF",
+        "assistant": "#C3E88D",
+    }
+    # Transcript HTML pieces, built once: a line is prefix + escaped text + suffix
+    _ROLE_PREFIX_HTML = {
+        role: f"<span style='color:{color}; font-weight:600'>{role.title()}:</span> <span style='color:#e8e8e8'>"
+        for role, color in _COLOR_MAP.items()
+    }
+    _DEFAULT_PREFIX = "<span style='color:#f1f1f1; font-weight:600'>{who}:</span> <span style='color:#e8e8e8'>"
+    _SUFFIX = "</span>"
+    # Serializes background metadata writes that share the same temp file
+    _write_lock = threading.Lock()
+
     def __init__(self, argv):
         super().__init__(argv)
         QtGui.QGuiApplication.setQuitOnLastWindowClosed(False)
@@ -571,7 +717,21 @@ class QuickGPT(QtWidgets.QApplication):
         self.debug = DEBUG
         self.working = False
         self.show_system = True
-        self.transcript: list[tuple[str, str]] = []
+        self.transcript: deque[tuple[str, str]] = deque(maxlen=TRANSCRIPT_MAX_LINES)
+        # Total lines ever appended; lets us map an absolute line number to a deque index
+        self._transcript_count = 0
+        self._thinking_idx: int | None = None
+        # Tracks where the most recently appended line starts (None after a full render). A
+        # QTextCursor follows edits, so it stays valid when old blocks are trimmed off the top.
+        self._last_line_cursor: QtGui.QTextCursor | None = None
+        # Every transcript line is its own block; the bottom margin spaces consecutive lines
+        self._line_format = QtGui.QTextBlockFormat()
+        self._line_format.setBottomMargin(12)
+        # Streaming reply state: absolute line number of the assistant line being filled in,
+        # the chunks received so far, and whether that line is still open at the document end
+        self._stream_idx: int | None = None
+        self._stream_parts: list[str] = []
+        self._stream_open = False
 
         self.popup = ChatPopup()
         self.model = DEFAULT_MODEL
@@ -587,6 +747,11 @@ class QuickGPT(QtWidgets.QApplication):
         self.tray.show()
 
         self.messages: list[dict] = []
+        # Coalesce metadata saves; restarting the timer extends the window on rapid changes
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
         self._load_history()
 
         self.popup.submitted.connect(self._handle_user_message)
@@ -611,9 +776,14 @@ class QuickGPT(QtWidgets.QApplication):
             self._append_system(f"Invalid QUICKGPT_HOTKEY '{HOTKEY}'. Example: ctrl+alt+space or ctrl+shift+g")
 
         if not self._native_ok:
+            keyboard = _get_keyboard()
             if keyboard is not None:
                 try:
-                    keyboard.add_hotkey(HOTKEY, lambda: self._on_hotkey(0, 0))
+                    # The keyboard callback fires on its own thread; hop onto the GUI thread first
+                    keyboard.add_hotkey(
+                        HOTKEY,
+                        lambda: QtCore.QMetaObject.invokeMethod(self, "_on_fallback_hotkey", QtCore.Qt.QueuedConnection),
+                    )
                     self._append_system(f"Global hotkey registered (fallback): {HOTKEY}")
                 except Exception as e:
                     self._append_system(f"Fallback hotkey '{HOTKEY}' failed: {e}. Try running as Administrator or pick another shortcut.")
@@ -621,6 +791,7 @@ class QuickGPT(QtWidgets.QApplication):
                 self._append_system("The 'keyboard' package is missing; global hotkey disabled. Install it with: pip install keyboard")
 
         self.aboutToQuit.connect(self._cleanup_hotkey)
+        self.aboutToQuit.connect(self._flush_pending_save)
 
     def _on_hotkey(self, mods: int, vk: int):
         # If user chose a bare Enter/Space hotkey, ignore while typing
@@ -633,127 +804,265 @@ class QuickGPT(QtWidgets.QApplication):
             self._append_system(f"[debug] WM_HOTKEY fired mods={mods} vk={vk}")
         self._toggle_popup()
 
+    @QtCore.Slot()
+    def _on_fallback_hotkey(self):
+        self._on_hotkey(0, 0)
+
     def _toggle_popup(self):
         # Don’t hide while a request is running
         if self.working and self.popup.isVisible():
             if self.debug:
                 self._append_system("[debug] Toggle blocked while working")
             return
-        QtCore.QTimer.singleShot(0, self.tray.toggle)
+        self.tray.toggle()
 
     # Chat workflow
     def _handle_user_message(self, text: str):
+        # Streaming state tracks a single reply, so only one request may be in flight
+        if self.working:
+            return
         if self.debug:
             self._append_system(f"[debug] Submit: {text[:60]}")
         self._append_user(text)
-        self._save_history()
         self._ask_assistant()
 
     def _ask_assistant(self):
         self.working = True
+        self.popup.set_busy(True)
         self.popup.start_rainbow()
-        self._append_system("Thinking…")
+        if len(self.messages) > MESSAGES_TRIM_AT:
+            self.messages = self.messages[-MESSAGES_KEEP:]
+        self._append_system(THINKING_TEXT)
+        self._thinking_idx = self._transcript_count - 1
         messages = ([{"role": "system", "content": "You are a concise, helpful assistant. Your name is QuickGPT. Avoid typing long paragraphs in one go. Quick, concise sentences are best."}] + self.messages[-20:])
-        worker = Worker(messages, self.model)
-        thread = QtCore.QThread()
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        # Store active references to ensure cleanup in main-thread slots
-        self._active_thread = thread
-        self._active_worker = worker
-        worker.finished.connect(self._on_reply)
-        worker.error.connect(self._on_error)
-        thread.start()
+        task = ChatTask(messages, self.model)
+        task.signals.chunk.connect(self._on_chunk)
+        task.signals.finished.connect(self._on_reply)
+        task.signals.error.connect(self._on_error)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    @QtCore.Slot(str)
+    def _on_chunk(self, text: str):
+        if self._stream_idx is None:
+            # First chunk: swap the placeholder for a new assistant line
+            self._remove_last_system_placeholder()
+            self._stream_parts = [text]
+            self.transcript.append(("Assistant", text))
+            self._transcript_count += 1
+            self._stream_idx = self._transcript_count - 1
+            self._open_stream_line()
+            return
+        self._stream_parts.append(text)
+        if self._stream_open:
+            cursor = self.popup.output.textCursor()
+            cursor.movePosition(QtGui.QTextCursor.End)
+            # Line separators keep the reply inside its own block
+            cursor.insertText(text.replace("\n", "\u2028"))
+            self.popup.output.ensureCursorVisible()
+        # Otherwise other lines were drawn after the reply started; the chunks stay
+        # buffered and _end_stream redraws once when the reply finishes
 
     @QtCore.Slot(str)
     def _on_reply(self, reply: str):
         self.popup.stop_rainbow()
-        self._remove_last_system_placeholder()
-        self._append_assistant(reply)
-        self._save_history()
+        if self._stream_idx is not None:
+            self._end_stream(reply)
+            self._store_message("assistant", reply)
+        else:
+            self._remove_last_system_placeholder()
+            self._append_assistant(reply)
         self.working = False
-        worker = getattr(self, "_active_worker", None)
-        thread = getattr(self, "_active_thread", None)
-        if worker is not None:
-            worker.deleteLater()
-            self._active_worker = None
-        if thread is not None:
-            thread.quit()
-            thread.wait()
-            thread.deleteLater()
-            self._active_thread = None
+        self.popup.set_busy(False)
 
     @QtCore.Slot(str)
     def _on_error(self, err: str):
         self.popup.stop_rainbow()
+        if self._stream_idx is not None:
+            self._end_stream("".join(self._stream_parts))
         self._remove_last_system_placeholder()
         self._append_system(f"Error: {err}")
         self.working = False
-        worker = getattr(self, "_active_worker", None)
-        thread = getattr(self, "_active_thread", None)
-        if worker is not None:
-            worker.deleteLater()
-            self._active_worker = None
-        if thread is not None:
-            thread.quit()
-            thread.wait()
-            thread.deleteLater()
-            self._active_thread = None
+        self.popup.set_busy(False)
 
     # History helpers
     def _load_history(self):
         try:
-            if HISTORY_PATH.exists():
-                data = json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-                self.messages = data.get("messages", [])
+            # A damaged sidecar only costs the saved model, never the transcript
+            try:
+                meta = _loads(HISTORY_META.read_bytes())
                 # restore last model if present
-                self.model = data.get("model", self.model)
-                try:
-                    self.popup.model_combo.setCurrentText(self.model)
-                except Exception:
-                    pass
-                if self.messages:
-                    for m in self.messages[-10:]:
-                        if m["role"] == "user":
-                            self._append_line("You", m["content"]) 
-                        elif m["role"] == "assistant":
-                            self._append_line("Assistant", m["content"]) 
+                self.model = meta.get("model", self.model)
+            except (OSError, ValueError, AttributeError):
+                pass
+            if HISTORY_JSONL.exists():
+                self.messages, total = self._read_jsonl(HISTORY_JSONL)
+                if total > MESSAGES_TRIM_AT:
+                    # Compact so the file (and the next startup's parse) stays bounded
+                    try:
+                        _atomic_write(HISTORY_JSONL, b"".join(_dumps(m) + b"\n" for m in self.messages))
+                    except OSError:
+                        pass
+            elif HISTORY_PATH.exists():
+                self._migrate_legacy_history()
+            try:
+                self.popup.model_combo.setCurrentText(self.model)
+            except Exception:
+                pass
+            if self.messages:
+                for m in self.messages[-10:]:
+                    if m["role"] == "user":
+                        self._append_line("You", m["content"]) 
+                    elif m["role"] == "assistant":
+                        self._append_line("Assistant", m["content"]) 
         except Exception:
             self.messages = []
 
-    def _save_history(self):
+    @staticmethod
+    def _read_jsonl(path: Path) -> tuple[list[dict], int]:
+        # Keep only the last MESSAGES_KEEP messages; also return how many were on disk.
+        # Decode line by line so one torn line (e.g. a crash mid-append) only loses that message
+        messages: deque[dict] = deque(maxlen=MESSAGES_KEEP)
+        total = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if not raw.strip():
+                    continue
+                try:
+                    msg = _loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(msg, dict) and "role" in msg and "content" in msg:
+                    messages.append(msg)
+                    total += 1
+        return list(messages), total
+
+    def _migrate_legacy_history(self):
+        # One-off conversion of the old history.json into history.jsonl + meta. The JSONL is
+        # written in one go, fsynced once and renamed into place before the old file is
+        # removed, so an interrupted migration leaves history.json intact and is retried.
+        data = _loads(HISTORY_PATH.read_bytes())
+        self.messages = data.get("messages", [])
+        self.model = data.get("model", self.model)
+        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write(HISTORY_JSONL, b"".join(_dumps(m) + b"\n" for m in self.messages))
+        self._do_write({"model": self.model, "version": HISTORY_VERSION})
+        HISTORY_PATH.unlink(missing_ok=True)
+
+    def _append_message_jsonl(self, msg: dict):
         try:
             HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-            HISTORY_PATH.write_text(
-                json.dumps({"messages": self.messages, "model": self.model}, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            with open(HISTORY_JSONL, "a+b") as f:
+                line = _dumps(msg) + b"\n"
+                # Never glue onto an unterminated line left behind by an interrupted write
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+        except Exception:
+            pass
+
+    def _flush_save(self):
+        # Build the payload on the GUI thread, then hand the disk I/O to a background thread
+        payload = {"model": self.model, "version": HISTORY_VERSION}
+        threading.Thread(target=self._do_write, args=(payload,), daemon=True).start()
+
+    @classmethod
+    def _do_write(cls, payload: dict):
+        try:
+            with cls._write_lock:
+                HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+                _atomic_write(HISTORY_META, _dumps(payload))
         except Exception:
             pass
 
+    def _flush_pending_save(self):
+        # On quit, write any debounced save synchronously so it isn't lost with the daemon thread
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_write({"model": self.model, "version": HISTORY_VERSION})
+
     # UI append helpers
     def _append_line(self, who: str, text: str):
         self.transcript.append((who, text))
-        self._render_transcript()
+        self._transcript_count += 1
+        if self.show_system or who != "System":
+            self._append_html_line(who, text)
+
+    def _store_message(self, role: str, text: str):
+        msg = {"role": role, "content": text}
+        self.messages.append(msg)
+        self._append_message_jsonl(msg)
 
     def _append_user(self, text: str):
-        self.messages.append({"role": "user", "content": text})
+        self._store_message("user", text)
         self._append_line("You", text)
 
     def _append_assistant(self, text: str):
-        self.messages.append({"role": "assistant", "content": text})
+        self._store_message("assistant", text)
         self._append_line("Assistant", text)
 
     def _append_system(self, text: str):
         self._append_line("System", text)
 
     def _remove_last_system_placeholder(self):
-        for i in range(len(self.transcript) - 1, -1, -1):
-            who, txt = self.transcript[i]
-            if who == "System" and txt == "Thinking…":
-                del self.transcript[i]
-                break
-        self._render_transcript()
+        idx, self._thinking_idx = self._thinking_idx, None
+        if idx is None:
+            return
+        i = self._transcript_pos(idx)
+        if i is None or self.transcript[i] != ("System", THINKING_TEXT):
+            return
+        is_last = i == len(self.transcript) - 1
+        del self.transcript[i]
+        if not self.show_system:
+            return  # placeholder was never drawn
+        if is_last and self._last_line_cursor is not None:
+            # Common case: the placeholder is the final line, so just cut it off the document
+            cursor = self.popup.output.textCursor()
+            cursor.setPosition(self._last_line_cursor.position())
+            cursor.movePosition(QtGui.QTextCursor.End, QtGui.QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+            self._last_line_cursor = None
+        else:
+            self._render_full()
+
+    def _transcript_pos(self, idx: int) -> int | None:
+        # Translate an absolute line number into the current deque position
+        i = idx - (self._transcript_count - len(self.transcript))
+        return i if 0 <= i < len(self.transcript) else None
+
+    def _sync_stream_line(self):
+        # Write the chunks received so far into the transcript entry of the streaming line
+        if self._stream_idx is None:
+            return
+        i = self._transcript_pos(self._stream_idx)
+        if i is not None:
+            self.transcript[i] = ("Assistant", "".join(self._stream_parts))
+
+    def _stream_is_last(self) -> bool:
+        return self._stream_idx is not None and self._transcript_pos(self._stream_idx) == len(self.transcript) - 1
+
+    def _open_stream_line(self):
+        # Draw the streaming line as the last block so later chunks can be appended to it
+        cursor = self.popup.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        start = self._insert_line(cursor, self._line_html("Assistant", "".join(self._stream_parts)))
+        self._mark_line_start(start)
+        self._stream_open = True
+        self.popup.output.ensureCursorVisible()
+
+    def _end_stream(self, text: str):
+        self._stream_parts = [text]
+        self._sync_stream_line()
+        was_open = self._stream_open and self._last_line_cursor is not None
+        self._stream_idx = None
+        self._stream_parts = []
+        self._stream_open = False
+        if was_open:
+            # The open line already holds every chunk and needs no terminator
+            self.popup.output.ensureCursorVisible()
+        else:
+            self._render_full()
 
     def _cleanup_hotkey(self):
         try:
@@ -765,16 +1074,26 @@ class QuickGPT(QtWidgets.QApplication):
     # Model selection handler
     def _on_model_changed(self, model: str):
         self.model = model
-        # Save selection promptly so it persists across restarts
-        self._save_history()
+        # Save selection (debounced) so it persists across restarts
+        self._save_timer.start()
 
     # Clear chat history handler
     def _clear_chat(self):
         self.messages = []
-        self.transcript = []
+        self.transcript.clear()
+        self._transcript_count = 0
+        self._thinking_idx = None
+        self._last_line_cursor = None
+        self._stream_idx = None
+        self._stream_parts = []
+        self._stream_open = False
         self.popup.output.clear()
         self._append_system("History cleared.")
-        self._save_history()
+        try:
+            HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+            HISTORY_JSONL.write_bytes(b"")
+        except Exception:
+            pass
 
     def _toggle_system(self):
         self.show_system = not self.show_system
@@ -783,35 +1102,82 @@ class QuickGPT(QtWidgets.QApplication):
             self.popup.sys_btn.setText("👁" if self.show_system else "🙈")
         except Exception:
             pass
-        self._render_transcript()
+        self._render_full()
+
+    @classmethod
+    def _line_prefix(cls, who: str) -> str:
+        return cls._ROLE_PREFIX_HTML.get(who.lower()) or cls._DEFAULT_PREFIX.format(who=html.escape(who))
+
+    @classmethod
+    def _line_html(cls, who: str, text: str) -> str:
+        return cls._line_prefix(who) + html.escape(text).replace("\n", "<br>") + cls._SUFFIX
+
+    def _insert_line(self, cursor: QtGui.QTextCursor, line_html: str) -> int:
+        # Put the line in its own block so the document's block cap trims whole lines.
+        # Returns the position before the block separator, i.e. where removing the line starts.
+        if not self.popup.output.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertHtml(line_html)
+        cursor.setBlockFormat(self._line_format)
+        # Read the position after inserting: the block cap may have trimmed lines above
+        return max(cursor.block().position() - 1, 0)
+
+    def _mark_line_start(self, pos: int):
+        cursor = QtGui.QTextCursor(self.popup.output.document())
+        cursor.setPosition(pos)
+        self._last_line_cursor = cursor
+
+    def _append_html_line(self, who: str, text: str):
+        # Append a single line at the end of the document without re-rendering the rest
+        cursor = self.popup.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        start = self._insert_line(cursor, self._line_html(who, text))
+        self._mark_line_start(start)
+        self._stream_open = False
+        self.popup.output.ensureCursorVisible()
 
-    def _render_transcript(self):
-        self.popup.output.clear()
-        for who, text in self.transcript:
-            if not self.show_system and who == "System":
-                continue
-            role = who.lower()
-            color_map = {
-                "system": "#FFB86C",
-                "you": "#80C7FF",
-                "assistant": "#C3E88D",
-            }
-            color = color_map.get(role, "#f1f1f1")
-            safe_text = html.escape(text).replace("\n", "<br>")
-            safe_who = html.escape(who)
-            html_line = f"<span style='color:{color}; font-weight:600'>{safe_who}:</span> <span style='color:#e8e8e8'>{safe_text}</span><br><br>"
-            cursor = self.popup.output.textCursor()
+    def _render_full(self):
+        # Rebuild the whole view; only needed when the visible set of lines changes
+        output = self.popup.output
+        show_sys = self.show_system
+        line_html = self._line_html
+        insert_line = self._insert_line
+        self._sync_stream_line()
+        lines = self.transcript
+        stream_last = self._stream_is_last()
+        if stream_last:
+            # The streaming reply stays open at the end; draw it separately below
+            lines = islice(self.transcript, len(self.transcript) - 1)
+
+        output.setUpdatesEnabled(False)
+        try:
+            output.clear()
+            self._last_line_cursor = None
+            self._stream_open = False
+            cursor = output.textCursor()
             cursor.movePosition(QtGui.QTextCursor.End)
-            cursor.insertHtml(html_line)
-        self.popup.output.ensureCursorVisible()
+            for who, text in lines:
+                if not show_sys and who == "System":
+                    continue
+                insert_line(cursor, line_html(who, text))
+            if stream_last:
+                self._open_stream_line()
+        finally:
+            output.setUpdatesEnabled(True)
+        output.ensureCursorVisible()
 
 
 def main():
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except Exception:
-        pass
+    # Skip importing python-dotenv entirely when there is no .env to load. load_dotenv()
+    # searches upward from the script's directory, or from the working directory when
+    # frozen/interactive, so check both trees (unresolved, as dotenv uses abspath).
+    roots = (Path(os.path.abspath(__file__)).parent, Path(os.path.abspath(os.getcwd())))
+    if any((d / ".env").is_file() for root in roots for d in (root, *root.parents)):
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except Exception:
+            pass
 
     app = QuickGPT(sys.argv)
     sys.exit(app.exec())